@@ -44,7 +44,7 @@ class LogEntryAdmin(admin.ModelAdmin, LogEntryAdminMixin):
 
     @cached_property
     def _own_url_names(self):
-        return [pattern.name for pattern in self.urls if pattern.name]
+        return frozenset(pattern.name for pattern in self.urls if pattern.name)
 
     def has_delete_permission(self, request, obj=None):
         if (